@@ -16,17 +16,20 @@ Supports:
 
 from __future__ import annotations
 
+import atexit
+import http.client
+import itertools
 import json
 import os
+import select
 import ssl
+import stat
 import sys
+import threading
 import time
-import urllib.error
-import urllib.request
 from base64 import b64encode
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
-from xml.sax.saxutils import escape as xml_escape
+from collections.abc import Iterable, Iterator
+from urllib.parse import urlsplit
 
 
 # ---------------------------------------------------------------------------
@@ -45,8 +48,9 @@ def env(name: str, default: str = "") -> str:
 
 def log(msg: str) -> None:
     """Print a timestamped log message."""
-    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"[vManager] ({ts}) {msg}", flush=True)
+    ts = time.strftime("%Y-%m-%d %H:%M:%S")
+    # One write per line, so lines from concurrent launches don't interleave
+    print(f"[vManager] ({ts}) {msg}\n", end="", flush=True)
 
 
 def log_group_start(title: str) -> None:
@@ -57,18 +61,25 @@ def log_group_end() -> None:
     print("::endgroup::", flush=True)
 
 
+# GITHUB_OUTPUT handle, opened on first use and closed (flushed) at exit
+_output_file = None
+
+
 def set_output(name: str, value: str) -> None:
     """Set a GitHub Actions output variable."""
+    global _output_file
     github_output = os.environ.get("GITHUB_OUTPUT", "")
     if github_output:
-        with open(github_output, "a") as f:
-            # Handle multi-line values
-            if "\n" in value:
-                import uuid
-                delimiter = f"ghadelimiter_{uuid.uuid4()}"
-                f.write(f"{name}<<{delimiter}\n{value}\n{delimiter}\n")
-            else:
-                f.write(f"{name}={value}\n")
+        if _output_file is None:
+            _output_file = open(github_output, "a")
+            atexit.register(_output_file.close)
+        # Handle multi-line values
+        if "\n" in value:
+            import uuid
+            delimiter = f"ghadelimiter_{uuid.uuid4()}"
+            _output_file.write(f"{name}<<{delimiter}\n{value}\n{delimiter}\n")
+        else:
+            _output_file.write(f"{name}={value}\n")
     else:
         # Fallback for local testing
         print(f"::set-output name={name}::{value}", flush=True)
@@ -85,10 +96,60 @@ def warn(msg: str) -> None:
     print(f"::warning::{msg}", flush=True)
 
 
+def _read_json_cache(path: str, ttl: float):
+    """
+    Return the JSON content of *path* if it is younger than *ttl* seconds, else None.
+
+    Symlinks and files not owned by the current user are ignored, so another
+    user of a shared temp directory cannot plant cache content.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    except OSError:
+        return None
+    try:
+        with os.fdopen(fd, "r", encoding="utf-8") as f:
+            st = os.fstat(f.fileno())
+            if not stat.S_ISREG(st.st_mode):
+                return None
+            if hasattr(os, "getuid") and st.st_uid != os.getuid():
+                return None
+            if time.time() - st.st_mtime > ttl:
+                return None
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json_cache(path: str, data) -> None:
+    """Atomically write *data* as JSON to *path*; cache write failures are ignored."""
+    import tempfile
+
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 
+# Run attributes always present in JUnit output; never treated as extra attributes.
+_BUILT_IN_RUN_ATTRS = frozenset({
+    "first_failure_name", "first_failure_description", "computed_seed", "test_group", "test_name",
+})
+
+
 class Config:
     """Parsed action inputs from environment variables."""
 
@@ -104,6 +165,8 @@ class Config:
 
         # Launcher
         self.vsif_path = env("INPUT_VSIF_PATH", "")
+        # Static VSIF path(s), semicolon-separated
+        self.vsif_files = [v.strip() for v in self.vsif_path.split(";") if v.strip()]
         self.vsif_input_file = env("INPUT_VSIF_INPUT_FILE", "")
         self.env_variables = env("INPUT_ENV_VARIABLES", "")
         self.attr_values = env("INPUT_ATTR_VALUES", "")
@@ -142,19 +205,169 @@ class Config:
         self.generate_junit = tobool(env("INPUT_GENERATE_JUNIT", "false"))
         self.junit_output_path = env("INPUT_JUNIT_OUTPUT_PATH", "session_runs.xml")
         self.extra_attributes = env("INPUT_EXTRA_ATTRIBUTES", "")
+        # Normalized once: stripped, no blanks/spaces, built-ins dropped, order kept
+        self.extra_attrs: tuple[str, ...] = tuple(dict.fromkeys(
+            a for a in (x.strip() for x in self.extra_attributes.split(","))
+            if a and " " not in a and a not in _BUILT_IN_RUN_ATTRS
+        ))
         self.no_append_seed = tobool(env("INPUT_NO_APPEND_SEED", "false"))
 
+    def parse_launch_extras(self) -> dict:
+        """
+        Parse the launcher inputs into the extra /rest/sessions/launch fields.
+
+        Raises ValueError if a JSON input (env-variables, attr-values,
+        define-values) does not parse.
+        """
+        extras = {}
+        for key, value, input_name in (
+            ("environment", self.env_variables, "env-variables"),
+            ("attributes", self.attr_values, "attr-values"),
+            ("params", self.define_values, "define-values"),
+        ):
+            if value:
+                try:
+                    extras[key] = json.loads(value)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Could not parse '{input_name}' as JSON: {e}") from e
+        if self.use_user_on_farm:
+            if self.user_private_ssh_key:
+                extras["credentials"] = {"connectType": "PUBLIC_KEY"}
+            else:
+                extras["credentials"] = {
+                    "username": self.farm_user or self.vapi_user,
+                    "password": self.farm_password or self.vapi_password,
+                }
+            if self.env_source_file:
+                extras["preliminaryStage"] = {
+                    "sourceFilePath": self.env_source_file,
+                    "shell": self.env_source_file_type,
+                }
+        return extras
+
 
 # ---------------------------------------------------------------------------
 # vAPI HTTP Client
 # ---------------------------------------------------------------------------
 
+def _json_template(obj: dict) -> str:
+    """Serialize *obj* once into a %-format string.
+
+    String values ``"%s"`` / ``"%d"`` become bare placeholders, filled in (in
+    key order) with pre-serialized JSON fragments at call time.
+    """
+    return json.dumps(obj).replace('"%s"', "%s").replace('"%d"', "%d")
+
+
+# Pre-serialized request bodies; only the placeholders vary between calls.
+_SESSION_STATUS_BODY = _json_template({
+    "filter": {"@c": ".InFilter", "attName": "id", "operand": "IN", "values": "%s"},
+    "pageLength": "%d",
+    "projection": {
+        "type": "SELECTION_ONLY",
+        "selection": ["id", "session_status", "name", "running", "waiting",
+                      "total_runs_in_session", "passed_runs", "failed_runs",
+                      "other_runs", "owner"],
+    },
+})
+
+_SESSIONS_BY_NAME_BODY = _json_template({
+    "filter": {"@c": ".ChainedFilter", "condition": "OR", "chain": "%s"},
+    "pageLength": 10000,
+    "settings": {"write-hidden": True, "stream-mode": False},
+    "projection": {"type": "SELECTION_ONLY", "selection": ["name", "id"]},
+})
+
+_RUNS_LIST_BODY = _json_template({
+    "filter": {
+        "condition": "AND",
+        "@c": ".ChainedFilter",
+        "chain": [{
+            "@c": ".RelationFilter",
+            "relationName": "session",
+            "filter": {
+                "condition": "AND",
+                "@c": ".ChainedFilter",
+                "chain": [{"@c": ".InFilter", "attName": "id", "operand": "IN", "values": "%s"}],
+            },
+        }],
+    },
+    "pageOffset": "%d",
+    "pageLength": "%d",
+    # A stable order keeps pageOffset pages from overlapping or skipping runs
+    "sortSpec": [{"attName": "id", "order": "ASC"}],
+    "settings": {"write-hidden": True, "stream-mode": True},
+    "projection": {"type": "SELECTION_ONLY", "selection": "%s"},
+})
+
+_RUN_SELECTION = (
+    "test_name", "status", "duration", "test_group",
+    "computed_seed", "id", "first_failure_name", "first_failure_description",
+)
+
+_SUSPEND_BODY = _json_template({
+    "filter": {"@c": ".InFilter", "attName": "id", "operand": "IN", "values": "%s"},
+})
+
+
 class VAPIClient:
-    """Low-level HTTP client for Cadence Verisium Manager vAPI."""
+    """Low-level HTTP client for Cadence Verisium Manager vAPI.
+
+    Connections are kept alive and pooled, so repeated calls (e.g. status
+    polling) skip the TCP/TLS handshake.  Use as a context manager, or call
+    :meth:`close`, to tear the pool down.
+    """
+
+    # Maximum number of idle keep-alive connections held in the pool.
+    POOL_MAXSIZE = 16
+    # Page size for /rest/runs/list queries; bounds the size of each response
+    # held in memory while it is parsed.
+    RUNS_PAGE_LENGTH = 10000
+    # Lifetime (seconds) of the on-disk attribute label cache.
+    ATTR_LABELS_CACHE_TTL = 600
+    # Retry policy for ``request(..., retry=True)``: attempts after the first,
+    # and the base of the exponential backoff (seconds).
+    RETRY_TOTAL = 3
+    RETRY_BACKOFF = 0.3
+    RETRY_STATUSES = frozenset({502, 503, 504})
 
     def __init__(self, cfg: Config):
         self.cfg = cfg
-        self._ssl_ctx = self._build_ssl_context()
+        url = urlsplit(cfg.vapi_url)
+        self._https = url.scheme == "https"
+        self._host = url.hostname or ""
+        self._port = url.port
+        self._base_path = url.path.rstrip("/")
+        self._proxy = self._find_proxy()
+        if self._proxy and not self._https:
+            # Plain HTTP through a proxy: requests carry the absolute URI
+            self._base_path = f"http://{url.netloc}{self._base_path}"
+        self._ssl_ctx = self._build_ssl_context() if self._https else None
+        self._pool: list[http.client.HTTPConnection] = []
+        self._pool_lock = threading.Lock()
+        self._attr_labels: dict[tuple[str, ...], dict[str, str]] = {}
+
+        # Request headers are fixed for the client's lifetime; build them once.
+        self._headers: dict[str, str] = {"Accept-Encoding": "gzip"}
+        if cfg.auth_required:
+            cred = f"{cfg.vapi_user}:{cfg.vapi_password}"
+            self._headers["Authorization"] = f"Basic {b64encode(cred.encode('utf-8')).decode('utf-8')}"
+        if self._proxy and not self._https:
+            self._headers.update(self._proxy[2])
+        self._json_headers = {**self._headers, "Content-Type": "application/json"}
+
+    def __enter__(self) -> VAPIClient:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, []
+        for conn in pool:
+            conn.close()
 
     def _build_ssl_context(self) -> ssl.SSLContext:
         ctx = ssl.create_default_context()
@@ -163,12 +376,71 @@ class VAPIClient:
             ctx.verify_mode = ssl.CERT_NONE
         return ctx
 
-    def _auth_header(self) -> str:
-        cred = f"{self.cfg.vapi_user}:{self.cfg.vapi_password}"
-        encoded = b64encode(cred.encode("utf-8")).decode("utf-8")
-        return f"Basic {encoded}"
+    def _find_proxy(self) -> tuple[str, int, dict[str, str]] | None:
+        """
+        Return ``(host, port, headers)`` of the proxy to reach the vAPI server
+        through, honoring ``http_proxy`` / ``https_proxy`` / ``no_proxy`` like urllib.
+        """
+        # urllib.request is slow to import; only consult it when a proxy is configured.
+        if not any(name.lower().endswith("_proxy") for name in os.environ):
+            return None
+        import urllib.request
+        from urllib.parse import unquote
+        proxy = urllib.request.getproxies().get("https" if self._https else "http")
+        if not proxy or urllib.request.proxy_bypass(self._host):
+            return None
+        parts = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+        headers = {}
+        if parts.username:
+            cred = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+            headers["Proxy-Authorization"] = f"Basic {b64encode(cred.encode('utf-8')).decode('utf-8')}"
+        return parts.hostname or "", parts.port or 80, headers
 
-    def request(self, path: str, method: str = "POST", body: str | None = None) -> dict | list | str:
+    def _acquire_connection(self) -> tuple[http.client.HTTPConnection, bool]:
+        """Return ``(connection, reused)`` – an idle pooled one if available."""
+        while True:
+            with self._pool_lock:
+                if not self._pool:
+                    break
+                conn = self._pool.pop()
+            # An idle socket that is readable has been closed by the server
+            # (or holds stray data); don't send a request on it.
+            if conn.sock is not None and not select.select([conn.sock], [], [], 0)[0]:
+                return conn, True
+            conn.close()
+        timeout = max(self.cfg.conn_timeout, self.cfg.read_timeout)
+        if self._proxy:
+            proxy_host, proxy_port, proxy_headers = self._proxy
+            if self._https:
+                # HTTPS is tunneled through the proxy with CONNECT
+                conn = http.client.HTTPSConnection(
+                    proxy_host, proxy_port, timeout=timeout, context=self._ssl_ctx
+                )
+                conn.set_tunnel(self._host, self._port, headers=proxy_headers)
+            else:
+                conn = http.client.HTTPConnection(proxy_host, proxy_port, timeout=timeout)
+        elif self._https:
+            conn = http.client.HTTPSConnection(
+                self._host, self._port, timeout=timeout, context=self._ssl_ctx
+            )
+        else:
+            conn = http.client.HTTPConnection(self._host, self._port, timeout=timeout)
+        return conn, False
+
+    def _release_connection(self, conn: http.client.HTTPConnection) -> None:
+        with self._pool_lock:
+            if len(self._pool) < self.POOL_MAXSIZE:
+                self._pool.append(conn)
+                return
+        conn.close()
+
+    def request(
+        self,
+        path: str,
+        method: str = "POST",
+        body: str | bytes | dict | list | None = None,
+        retry: bool = False,
+    ) -> dict | list | str:
         """
         Make an HTTP request to the vAPI server.
 
@@ -178,8 +450,12 @@ class VAPIClient:
             REST path appended to the base URL  (e.g. ``/rest/sessions/launch``).
         method : str
             HTTP method.
-        body : str | None
-            JSON body string for POST / PUT.
+        body : str | bytes | dict | list | None
+            JSON body for POST / PUT – pre-serialized, or an object to encode.
+        retry : bool
+            Retry refused/reset connections and 502/503/504 responses with
+            exponential backoff.  Only for requests that are safe to repeat
+            (queries).  Timeouts and SSL errors are never retried.
 
         Returns
         -------
@@ -189,82 +465,102 @@ class VAPIClient:
         ------
         VAPIError on HTTP errors.
         """
-        url = f"{self.cfg.vapi_url}{path}"
-        headers = {}
-        if method in ("POST", "PUT"):
-            headers["Content-Type"] = "application/json"
-        if self.cfg.auth_required:
-            headers["Authorization"] = self._auth_header()
+        url = f"{self._base_path}{path}"
+        headers = self._json_headers if method in ("POST", "PUT") else self._headers
 
-        data = body.encode("utf-8") if body else None
-        req = urllib.request.Request(url, data=data, headers=headers, method=method)
+        if isinstance(body, (dict, list)):
+            data = json.dumps(body, separators=(",", ":")).encode("utf-8")
+        elif isinstance(body, str):
+            data = body.encode("utf-8") if body else None
+        else:
+            data = body or None
 
-        try:
-            with urllib.request.urlopen(
-                req, timeout=max(self.cfg.conn_timeout, self.cfg.read_timeout), context=self._ssl_ctx
-            ) as resp:
-                raw = resp.read().decode("utf-8")
-                if not raw.strip():
-                    return {}
-                try:
-                    return json.loads(raw)
-                except json.JSONDecodeError:
-                    return raw
-        except urllib.error.HTTPError as exc:
-            err_body = ""
+        attempt = 0
+        while True:
+            conn, reused = self._acquire_connection()
+            sent = False
+            error = None
             try:
-                err_body = exc.read().decode("utf-8", errors="replace")
-            except Exception:
-                pass
-            raise VAPIError(exc.code, err_body) from exc
-        except urllib.error.URLError as exc:
-            raise VAPIError(0, str(exc.reason)) from exc
+                conn.request(method, url, body=data, headers=headers)
+                sent = True
+                resp = conn.getresponse()
+                status = resp.status
+                content_encoding = resp.getheader("Content-Encoding", "")
+                raw = resp.read()
+            except (ConnectionRefusedError, ConnectionResetError, BrokenPipeError) as exc:
+                # ConnectionResetError also covers http.client.RemoteDisconnected
+                conn.close()
+                if reused and not sent:
+                    # The server dropped an idle keep-alive connection before the request
+                    # went out, so it cannot have been processed; resend on a fresh one.
+                    continue
+                error = exc
+            except (http.client.HTTPException, OSError) as exc:
+                # Timeouts, TLS/certificate failures, malformed responses: not transient
+                conn.close()
+                raise VAPIError(0, str(exc)) from exc
+            else:
+                self._release_connection(conn)
+                if status not in self.RETRY_STATUSES:
+                    break
+
+            if not retry or attempt >= self.RETRY_TOTAL:
+                if error is not None:
+                    raise VAPIError(0, str(error)) from error
+                break
+            time.sleep(self.RETRY_BACKOFF * 2 ** attempt)
+            attempt += 1
+
+        if content_encoding.lower() == "gzip":
+            import gzip
+            raw = gzip.decompress(raw)
+
+        if not 200 <= status < 300:
+            raise VAPIError(status, raw.decode("utf-8", errors="replace"))
+
+        # isspace() instead of strip(): no copy of a potentially large payload
+        if not raw or raw.isspace():
+            return {}
+        try:
+            # json.loads detects the encoding of bytes itself; no separate decode pass
+            return json.loads(raw)
+        except ValueError:
+            return raw.decode("utf-8", errors="replace")
 
     # ---- Convenience wrappers ----
 
     def check_connection(self) -> None:
         """Verify we can reach the vAPI server."""
         log("Testing connection to vManager vAPI...")
-        result = self.request("/rest/sessions/count", "POST", "{}")
+        result = self.request("/rest/sessions/count", "POST", {}, retry=True)
         if isinstance(result, dict) and "count" in result:
             log(f"Connection OK – {result['count']} sessions on the server.")
         else:
             log(f"Connection response: {result}")
 
-    def launch_vsif(self, vsif: str, extra_json: str = "") -> str:
+    def launch_vsif(self, vsif: str, extras: dict | None = None) -> str:
         """Launch a single VSIF and return the session ID."""
-        payload = f'{{"vsif":"{vsif}"'
-        if extra_json:
-            payload += f",{extra_json}"
-        payload += "}"
+        payload = {"vsif": vsif}
+        if extras:
+            payload.update(extras)
         log(f"Launching VSIF: {vsif}")
         result = self.request("/rest/sessions/launch", "POST", payload)
         session_id = str(result.get("value", "")) if isinstance(result, dict) else ""
         if not session_id:
             raise VAPIError(0, f"No session ID returned for VSIF {vsif}. Response: {result}")
-        log(f"  → Session ID: {session_id}")
+        log(f"  → Session ID: {session_id} ({vsif})")
         return session_id
 
-    def get_session_status(self, session_id: str) -> dict:
-        """Query the status of a session by ID."""
-        body = json.dumps({
-            "filter": {
-                "attName": "id",
-                "operand": "EQUALS",
-                "@c": ".AttValueFilter",
-                "attValue": session_id,
-            },
-            "projection": {
-                "type": "SELECTION_ONLY",
-                "selection": ["session_status", "name", "running", "waiting",
-                              "total_runs_in_session", "passed_runs", "failed_runs",
-                              "other_runs", "owner"],
-            },
-        })
-        result = self.request("/rest/sessions/list", "POST", body)
-        if isinstance(result, list) and len(result) > 0:
-            return result[0]
-        return {}
+    def get_session_statuses(self, session_ids: list[str]) -> dict[str, dict]:
+        """Query the status of several sessions in one call, keyed by session ID."""
+        body = _SESSION_STATUS_BODY % (json.dumps(session_ids), max(len(session_ids), 1))
+        result = self.request("/rest/sessions/list", "POST", body, retry=True)
+        statuses = {}
+        if isinstance(result, list):
+            for item in result:
+                if "id" in item:
+                    statuses[str(item["id"])] = item
+        return statuses
 
     def get_session_ids_by_names(self, names: list[str]) -> list[str]:
         """Look up session IDs given session names."""
@@ -276,20 +572,8 @@ class VAPIClient:
                 "@c": ".AttValueFilter",
                 "attValue": name.strip(),
             })
-        body = json.dumps({
-            "filter": {
-                "@c": ".ChainedFilter",
-                "condition": "OR",
-                "chain": chain,
-            },
-            "pageLength": 10000,
-            "settings": {"write-hidden": True, "stream-mode": False},
-            "projection": {
-                "type": "SELECTION_ONLY",
-                "selection": ["name", "id"],
-            },
-        })
-        result = self.request("/rest/sessions/list", "POST", body)
+        body = _SESSIONS_BY_NAME_BODY % json.dumps(chain)
+        result = self.request("/rest/sessions/list", "POST", body, retry=True)
         ids = []
         if isinstance(result, list):
             for item in result:
@@ -298,60 +582,64 @@ class VAPIClient:
                     log(f"  Found session ID {item['id']} for name '{item.get('name', '?')}'")
         return ids
 
-    def get_runs(self, session_ids: list[str], extra_attrs: list[str] | None = None) -> list[dict]:
-        """Fetch run details for given session IDs."""
-        selection = [
-            "test_name", "status", "duration", "test_group",
-            "computed_seed", "id", "first_failure_name", "first_failure_description",
-        ]
-        if extra_attrs:
-            for attr in extra_attrs:
-                attr = attr.strip()
-                if attr and attr not in selection:
-                    selection.append(attr)
-
-        all_runs = []
-        for sid in session_ids:
-            body = json.dumps({
-                "filter": {
-                    "condition": "AND",
-                    "@c": ".ChainedFilter",
-                    "chain": [{
-                        "@c": ".RelationFilter",
-                        "relationName": "session",
-                        "filter": {
-                            "condition": "AND",
-                            "@c": ".ChainedFilter",
-                            "chain": [{
-                                "@c": ".InFilter",
-                                "attName": "id",
-                                "operand": "IN",
-                                "values": [sid],
-                            }],
-                        },
-                    }],
-                },
-                "pageLength": 100000,
-                "settings": {"write-hidden": True, "stream-mode": True},
-                "projection": {
-                    "type": "SELECTION_ONLY",
-                    "selection": selection,
-                },
-            })
-            try:
-                result = self.request("/rest/runs/list", "POST", body)
-                if isinstance(result, list):
-                    all_runs.extend(result)
-            except VAPIError as e:
-                warn(f"Failed to fetch runs for session {sid}: {e}")
-        return all_runs
+    def iter_runs(
+        self, session_ids: list[str], extra_attrs: tuple[str, ...] = (), total_runs: int | None = None
+    ) -> Iterator[dict]:
+        """Yield run details for all given session IDs, requesting one page at a time.
+
+        ``extra_attrs`` is expected to be normalized already (see ``Config.extra_attrs``).
+        ``total_runs``, when known from the session status, bounds the paging.
+        """
+        selection = list(_RUN_SELECTION)
+        selection.extend(attr for attr in extra_attrs if attr not in _RUN_SELECTION)
+
+        values_json = json.dumps(session_ids)
+        selection_json = json.dumps(selection)
+        offset = 0
+        prev_first_id = None
+        try:
+            while True:
+                body = _RUNS_LIST_BODY % (values_json, offset, self.RUNS_PAGE_LENGTH, selection_json)
+                result = self.request("/rest/runs/list", "POST", body, retry=True)
+                if not isinstance(result, list) or not result:
+                    return
+                first_id = result[0].get("id") if isinstance(result[0], dict) else None
+                if offset and first_id is not None and first_id == prev_first_id:
+                    # The server ignored pageOffset and sent the same page again
+                    warn(f"Run paging did not advance at offset {offset}; stopping.")
+                    return
+                prev_first_id = first_id
+                yield from result
+                if len(result) < self.RUNS_PAGE_LENGTH:
+                    return
+                offset += self.RUNS_PAGE_LENGTH
+                if total_runs is not None and offset >= total_runs:
+                    return
+        except VAPIError as e:
+            warn(f"Failed to fetch runs for {len(session_ids)} session(s): {e}")
+
+    def get_run_attribute_labels(self, attrs: tuple[str, ...]) -> dict[str, str]:
+        """
+        Get display labels for run attributes from the schema.
+
+        ``attrs`` is expected to be normalized already (see ``Config.extra_attrs``).
+        Results are cached per (server, attribute set): in memory for this
+        client, and on disk for ``ATTR_LABELS_CACHE_TTL`` seconds so repeated
+        workflow runs on the same runner skip the schema request.
+        """
+        key = tuple(sorted(attrs))
+        if key in self._attr_labels:
+            return self._attr_labels[key]
+        cache_path = self._attr_labels_cache_path(key)
+        labels = _read_json_cache(cache_path, self.ATTR_LABELS_CACHE_TTL)
+        if isinstance(labels, dict):
+            self._attr_labels[key] = labels
+            return labels
 
-    def get_run_attribute_labels(self, attrs: list[str]) -> dict[str, str]:
-        """Get display labels for run attributes from the schema."""
         labels = {}
         try:
             result = self.request(
-                "/rest/$schema/response?action=list&component=runs&extended=true", "GET"
+                "/rest/$schema/response?action=list&component=runs&extended=true", "GET", retry=True
             )
             if isinstance(result, dict) and "items" in result:
                 items = result["items"]
@@ -361,7 +649,6 @@ class VAPIClient:
                 if isinstance(props, str):
                     props = json.loads(props)
                 for attr in attrs:
-                    attr = attr.strip()
                     if attr in props:
                         prop = props[attr]
                         if isinstance(prop, str):
@@ -369,18 +656,36 @@ class VAPIClient:
                         labels[attr] = prop.get("title", attr)
         except Exception as e:
             warn(f"Failed to fetch attribute labels: {e}")
+            return labels
+        self._attr_labels[key] = labels
+        _write_json_cache(cache_path, labels)
         return labels
 
+    def _attr_labels_cache_path(self, key: tuple[str, ...]) -> str:
+        import hashlib
+        import tempfile
+        digest = hashlib.sha1(f"{self.cfg.vapi_url}|{','.join(key)}".encode("utf-8")).hexdigest()
+        return os.path.join(tempfile.gettempdir(), f"vapi_attr_labels_{digest}.json")
+
+    def iter_runs_with_attr_labels(
+        self, session_ids: list[str], extra_attrs: tuple[str, ...] = (), total_runs: int | None = None
+    ) -> tuple[Iterator[dict], dict[str, str]]:
+        """Stream runs and fetch extra attribute labels, overlapping the labels
+        request with the request for the first page of runs."""
+        runs = self.iter_runs(session_ids, extra_attrs, total_runs)
+        if not extra_attrs:
+            return runs, {}
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=1) as ex:
+            labels = ex.submit(self.get_run_attribute_labels, extra_attrs)
+            first = next(runs, None)
+        if first is None:
+            return iter(()), labels.result()
+        return itertools.chain((first,), runs), labels.result()
+
     def suspend_sessions(self, session_ids: list[str]) -> None:
         """Suspend (pause) sessions."""
-        body = json.dumps({
-            "filter": {
-                "@c": ".InFilter",
-                "attName": "id",
-                "operand": "IN",
-                "values": session_ids,
-            }
-        })
+        body = _SUSPEND_BODY % json.dumps(session_ids)
         try:
             self.request("/rest/sessions/suspend", "POST", body)
             log("Sessions suspended.")
@@ -401,6 +706,11 @@ class VAPIError(Exception):
 # Session Waiting
 # ---------------------------------------------------------------------------
 
+# Early poll delays (seconds) before settling on ``poll_interval``, so sessions
+# that finish quickly are noticed without waiting a full interval.
+_POLL_RAMP = (5, 10, 20, 30)
+
+
 class SessionWaiter:
     """Wait for sessions to reach terminal states, applying resolver logic."""
 
@@ -408,30 +718,38 @@ class SessionWaiter:
         self.client = client
         self.cfg = cfg
         self.session_ids = list(session_ids)
-        self.remaining = list(session_ids)
+        self.remaining = set(session_ids)
         self.session_names: dict[str, str] = {}
         # Double-check map for rerun detection (same as Jenkins plugin logic)
         self.completed_last_check: dict[str, bool] = {}
         self.final_state: dict[str, bool] = {}
-
-    def _get_resolver(self, state: str) -> str:
-        resolvers = {
-            "inaccessible": self.cfg.inaccessible_resolver,
-            "stopped": self.cfg.stopped_resolver,
-            "failed": self.cfg.failed_resolver,
-            "done": self.cfg.done_resolver,
-            "suspended": self.cfg.suspended_resolver,
+        self._resolvers = {
+            "inaccessible": cfg.inaccessible_resolver,
+            "stopped": cfg.stopped_resolver,
+            "failed": cfg.failed_resolver,
+            "done": cfg.done_resolver,
+            "suspended": cfg.suspended_resolver,
             "completed": "continue",
         }
-        return resolvers.get(state, "ignore")
+
+    def _get_resolver(self, state: str) -> str:
+        return self._resolvers.get(state, "ignore")
 
     def _check_all_done(self, session_id: str) -> bool:
         """Check if session is truly done (second consecutive check with no running/waiting runs)."""
         if self.final_state.get(session_id):
-            if session_id in self.remaining:
-                self.remaining.remove(session_id)
+            self.remaining.discard(session_id)
         return len(self.remaining) == 0
 
+    def _poll_delays(self):
+        """Yield sleep durations: a short ramp-up, then ``poll_interval`` forever."""
+        for delay in _POLL_RAMP:
+            if delay >= self.cfg.poll_interval:
+                break
+            yield delay
+        while True:
+            yield self.cfg.poll_interval
+
     def wait(self) -> tuple[bool, dict]:
         """
         Block until all sessions reach a terminal state or timeout.
@@ -441,42 +759,45 @@ class SessionWaiter:
         (success, aggregated_status) – success is False if the build should fail.
         """
         log("Waiting for sessions to complete...")
-        log(f"  Polling every {self.cfg.poll_interval}s, timeout {self.cfg.session_timeout // 60}min")
+        log(f"  Polling every {self.cfg.poll_interval}s (after a short ramp-up), timeout {self.cfg.session_timeout // 60}min")
 
-        start_time = time.time()
+        # Monotonic clock: immune to wall-clock steps (e.g. NTP) on long-running jobs
+        deadline = time.monotonic() + self.cfg.session_timeout
         status_print_interval = 30 * 60  # Print full status every 30 min
-        last_status_print = 0.0
+        next_status_print = 0.0
         aggregated = {}
+        delays = self._poll_delays()
 
         while True:
             # Timeout check
-            elapsed = time.time() - start_time
-            if self.cfg.session_timeout > 0 and elapsed > self.cfg.session_timeout:
+            if self.cfg.session_timeout > 0 and time.monotonic() > deadline:
                 fail(f"Timeout: waited more than {self.cfg.session_timeout // 60} minutes.")
 
             # Sleep
-            time.sleep(self.cfg.poll_interval)
+            time.sleep(next(delays))
 
-            should_print = (time.time() - last_status_print) > status_print_interval
+            now = time.monotonic()
+            should_print = now >= next_status_print
             if should_print:
-                last_status_print = time.time()
+                next_status_print = now + status_print_interval
 
-            # Poll each session
+            # Poll all sessions in a single call
             build_failed = False
             build_success = False
 
-            for sid in list(self.session_ids):
-                try:
-                    info = self.client.get_session_status(sid)
-                except VAPIError as e:
-                    if should_print:
-                        warn(f"Server error while checking session {sid}: {e}")
-                    continue
-                except Exception as e:
-                    if should_print:
-                        warn(f"Connection error: {e} – will retry.")
-                    break  # break inner loop, continue outer
+            try:
+                statuses = self.client.get_session_statuses(self.session_ids)
+            except VAPIError as e:
+                if should_print:
+                    warn(f"Server error while checking sessions: {e}")
+                continue
+            except Exception as e:
+                if should_print:
+                    warn(f"Connection error: {e} – will retry.")
+                continue
 
+            for sid in self.session_ids:
+                info = statuses.get(sid)
                 if not info:
                     log(f"Session {sid} appears to have been deleted. Failing.")
                     build_failed = True
@@ -567,98 +888,127 @@ def _safe_int(v) -> int:
 # JUnit XML Generation
 # ---------------------------------------------------------------------------
 
+# Multi-value separator used by vManager in attribute values, and its JUnit rendering
+_SEP_TOKEN = "<__SEPARATOR__>"
+_SEP_REPL = "\n    "
+
+
 def generate_junit_xml(
-    runs: list[dict],
+    runs: Iterable[dict],
     output_path: str,
-    extra_attrs: list[str],
+    extra_attrs: tuple[str, ...],
     attr_labels: dict[str, str],
     no_append_seed: bool,
-) -> None:
-    """Generate a JUnit-compatible XML file from vManager run data."""
-    if not runs:
-        log("No runs found – skipping JUnit XML generation.")
-        return
-
-    lines = ['<?xml version="1.0" encoding="UTF-8"?>']
-    lines.append(f'<testsuite tests="{len(runs)}" name="Verisium Manager">')
-
-    for run in runs:
-        status = run.get("status", "NA")
-        test_group = _xml_safe(run.get("test_group", "NA"))
-        test_name = _xml_safe(run.get("test_name", "NA"))
-        seed = _xml_safe(run.get("computed_seed", "NA"))
-        duration = run.get("duration", 0)
-        try:
-            duration = int(duration)
-        except (ValueError, TypeError):
-            duration = 0
-
-        seed_suffix = "" if no_append_seed else f" : Seed-{seed}"
-        full_name = f"{test_name}{seed_suffix}"
-
-        if status == "failed":
-            error_name = _xml_safe(run.get("first_failure_name", "RUN_STILL_IN_PROGRESS"))
-            error_desc = _xml_safe(run.get("first_failure_description",
-                "Run is in state running, other or waiting. "
-                "Reason for run to mark as failed is because session changed status."))
-            extra = _build_extra_attr_text(run, extra_attrs, attr_labels)
-            lines.append(
-                f'    <testcase classname="{test_group}" name="{full_name}" time="{duration}">'
-            )
-            lines.append(
-                f'      <failure message="{error_name}" type="{error_name}">'
-                f'First Error Description: \n{error_desc}\n'
-                f'Computed Seed: \n{seed}\n'
-                f'{extra}'
-                f'</failure>'
-            )
-            lines.append('    </testcase>')
-
-        elif status in ("stopped", "running", "other", "waiting"):
-            lines.append(
-                f'    <testcase classname="{test_group}" name="{full_name}" time="{duration}">'
-            )
-            lines.append('      <skipped />')
-            lines.append('    </testcase>')
-
-        else:
-            # passed or other terminal
-            lines.append(
-                f'    <testcase classname="{test_group}" name="{full_name}" time="{duration}"/>'
-            )
+) -> int:
+    """
+    Generate a JUnit-compatible XML file from vManager run data.
+
+    ``runs`` is consumed once, so it can be a stream (see ``VAPIClient.iter_runs``).
+    Returns the number of runs written.
+    """
+    # Imported lazily: xml.sax.saxutils pulls in urllib.request, which only this mode needs.
+    import shutil
+    import tempfile
+    from xml.sax.saxutils import XMLGenerator
+
+    labeled_attrs = [(attr, attr_labels.get(attr, attr)) for attr in extra_attrs]
+    count = 0
+
+    # Testcases go to a scratch file first: <testsuite tests=".."> needs the
+    # run count, which is only known once the stream is exhausted.  Both files
+    # are binary so XMLGenerator does the encoding on every platform.
+    with tempfile.TemporaryFile("w+b", buffering=1 << 16) as body:
+        gen = XMLGenerator(body, encoding="UTF-8", short_empty_elements=True)
+
+        for run in runs:
+            count += 1
+            status = run.get("status", "NA")
+            test_group = _as_text(run.get("test_group", "NA"))
+            test_name = _as_text(run.get("test_name", "NA"))
+            seed = _as_text(run.get("computed_seed", "NA"))
+            duration = run.get("duration", 0)
+            try:
+                duration = int(duration)
+            except (ValueError, TypeError):
+                duration = 0
+
+            seed_suffix = "" if no_append_seed else f" : Seed-{seed}"
+            full_name = f"{test_name}{seed_suffix}"
+
+            gen.ignorableWhitespace("\n    ")
+            gen.startElement("testcase", {"classname": test_group, "name": full_name, "time": str(duration)})
+
+            if status == "failed":
+                error_name = _as_text(run.get("first_failure_name", "RUN_STILL_IN_PROGRESS"))
+                error_desc = _as_text(run.get("first_failure_description",
+                    "Run is in state running, other or waiting. "
+                    "Reason for run to mark as failed is because session changed status."))
+                extra = _build_extra_attr_text(run, labeled_attrs)
+                gen.ignorableWhitespace("\n      ")
+                gen.startElement("failure", {"message": error_name, "type": error_name})
+                gen.characters(
+                    f"First Error Description: \n{error_desc}\n"
+                    f"Computed Seed: \n{seed}\n"
+                    f"{extra}"
+                )
+                gen.endElement("failure")
+                gen.ignorableWhitespace("\n    ")
+
+            elif status in ("stopped", "running", "other", "waiting"):
+                gen.ignorableWhitespace("\n      ")
+                gen.startElement("skipped", {})
+                gen.endElement("skipped")
+                gen.ignorableWhitespace("\n    ")
+
+            # passed or other terminal: empty <testcase/>
+            gen.endElement("testcase")
+
+        log(f"Fetched {count} run(s) for JUnit report.")
+        if not count:
+            log("No runs found – writing an empty JUnit report.")
+            _write_empty_junit(output_path)
+            return 0
+
+        gen.ignorableWhitespace("\n")
+        body.seek(0)
+        os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else ".", exist_ok=True)
+        with open(output_path, "wb", buffering=1 << 16) as f:
+            gen = XMLGenerator(f, encoding="UTF-8")
+            gen.startDocument()
+            gen.startElement("testsuite", {"tests": str(count), "name": "Verisium Manager"})
+            shutil.copyfileobj(body, f)
+            gen.endElement("testsuite")
+            gen.ignorableWhitespace("\n")
+            gen.endDocument()
+    log(f"JUnit XML report written to: {output_path}")
+    return count
 
-    lines.append('</testsuite>')
 
-    xml_content = "\n".join(lines) + "\n"
+def _write_empty_junit(output_path: str) -> None:
+    """Write a valid JUnit report with no testcases."""
     os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else ".", exist_ok=True)
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write(xml_content)
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n<testsuite tests="0" name="Verisium Manager"/>\n')
     log(f"JUnit XML report written to: {output_path}")
 
 
-def _xml_safe(text) -> str:
-    """Escape special XML characters."""
-    if text is None:
+def _as_text(value) -> str:
+    """Convert a vAPI field value to text (XMLGenerator does the escaping)."""
+    if value is None:
         return "NA"
-    s = str(text)
-    return xml_escape(s, {'"': "&quot;", "'": "&apos;"})
+    return str(value)
 
 
-def _build_extra_attr_text(run: dict, attrs: list[str], labels: dict[str, str]) -> str:
-    """Build extra attribute text for JUnit failure messages."""
-    if not attrs:
+def _build_extra_attr_text(run: dict, labeled_attrs: list[tuple[str, str]]) -> str:
+    """Build extra attribute text for JUnit failure messages from ``(attr, label)`` pairs."""
+    if not labeled_attrs:
         return ""
-    built_in = {"first_failure_name", "first_failure_description", "computed_seed", "test_group", "test_name"}
     parts = []
-    for attr in attrs:
-        attr = attr.strip()
-        if not attr or " " in attr or attr in built_in:
-            continue
+    for attr, label in labeled_attrs:
         val = run.get(attr, "NA")
         if isinstance(val, str):
-            val = val.replace("<__SEPARATOR__>", "\n    ")
-        label = labels.get(attr, attr)
-        parts.append(f"{label}:\n    {_xml_safe(val)}")
+            val = val.replace(_SEP_TOKEN, _SEP_REPL)
+        parts.append(f"{label}:\n    {_as_text(val)}")
     return "\n".join(parts)
 
 
@@ -676,8 +1026,7 @@ def run_launcher_mode(client: VAPIClient, cfg: Config) -> list[str]:
     # Determine VSIF list
     vsif_files = []
     if cfg.vsif_path:
-        # Static VSIF path(s), semicolon-separated
-        vsif_files = [v.strip() for v in cfg.vsif_path.split(";") if v.strip()]
+        vsif_files = cfg.vsif_files
         log(f"Static VSIF file(s): {vsif_files}")
     elif cfg.vsif_input_file:
         # Dynamic: read from file
@@ -689,45 +1038,31 @@ def run_launcher_mode(client: VAPIClient, cfg: Config) -> list[str]:
     if not vsif_files:
         fail("No VSIF files found to launch.")
 
-    # Build extra JSON parts
-    extra_parts = []
-    if cfg.env_variables:
-        extra_parts.append(f'"environment":{cfg.env_variables}')
-    if cfg.attr_values:
-        try:
-            attrs = json.loads(cfg.attr_values)
-            extra_parts.append(f'"attributes":{json.dumps(attrs)}')
-        except json.JSONDecodeError:
-            warn(f"Could not parse attr-values as JSON: {cfg.attr_values}")
-    if cfg.define_values:
-        try:
-            defines = json.loads(cfg.define_values)
-            extra_parts.append(f'"params":{json.dumps(defines)}')
-        except json.JSONDecodeError:
-            warn(f"Could not parse define-values as JSON: {cfg.define_values}")
-    if cfg.use_user_on_farm:
-        if cfg.user_private_ssh_key:
-            extra_parts.append('"credentials":{"connectType":"PUBLIC_KEY"}')
-        else:
-            farm_user = cfg.farm_user or cfg.vapi_user
-            farm_pass = cfg.farm_password or cfg.vapi_password
-            extra_parts.append(f'"credentials":{{"username":"{farm_user}","password":"{farm_pass}"}}')
-        if cfg.env_source_file:
-            extra_parts.append(
-                f'"preliminaryStage":{{"sourceFilePath":"{cfg.env_source_file}",'
-                f'"shell":"{cfg.env_source_file_type}"}}'
-            )
-
-    extra_json = ",".join(extra_parts)
+    # Parsed once for all VSIFs; a malformed input must not launch with fields missing
+    try:
+        launch_extras = cfg.parse_launch_extras()
+    except ValueError as e:
+        fail(str(e))
+
+    # Launch the VSIFs concurrently – each launch is an independent request.
+    # Stop submitting on the first failure; launches already in flight finish.
+    from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+    with ThreadPoolExecutor(max_workers=min(8, len(vsif_files))) as ex:
+        futures = [ex.submit(client.launch_vsif, vsif, launch_extras) for vsif in vsif_files]
+        wait(futures, return_when=FIRST_EXCEPTION)
+        for future in futures:
+            future.cancel()
 
-    # Launch each VSIF
     session_ids = []
-    for vsif in vsif_files:
-        try:
-            sid = client.launch_vsif(vsif, extra_json)
-            session_ids.append(sid)
-        except VAPIError as e:
-            fail(f"Failed to launch VSIF '{vsif}': {e}")
+    failure = None
+    for vsif, future in zip(vsif_files, futures):
+        if future.cancelled():
+            continue
+        error = future.exception()
+        if error is None:
+            session_ids.append(future.result())
+        elif failure is None:
+            failure = (vsif, error)
 
     log(f"Launched {len(session_ids)} session(s): {session_ids}")
 
@@ -736,6 +1071,14 @@ def run_launcher_mode(client: VAPIClient, cfg: Config) -> list[str]:
         for sid in session_ids:
             f.write(f"${sid}\n")
 
+    if failure is not None:
+        # Report the sessions that did launch so they can still be tracked or cleaned up
+        set_output("session-ids", ",".join(session_ids))
+        vsif, error = failure
+        if not isinstance(error, VAPIError):
+            raise error
+        fail(f"Failed to launch VSIF '{vsif}': {error}")
+
     log_group_end()
     return session_ids
 
@@ -809,7 +1152,7 @@ def _read_lines_from_file(filepath: str) -> list[str]:
     """Read non-empty lines from a text file."""
     try:
         with open(filepath, "r") as f:
-            return [line.strip() for line in f if line.strip()]
+            return [line for line in map(str.strip, f) if line]
     except FileNotFoundError:
         fail(f"File not found: {filepath}")
     return []
@@ -825,8 +1168,11 @@ def main() -> None:
     if not cfg.vapi_url:
         fail("'vapi-url' is required.")
 
-    client = VAPIClient(cfg)
+    with VAPIClient(cfg) as client:
+        _run(client, cfg)
+
 
+def _run(client: VAPIClient, cfg: Config) -> None:
     # Test connection
     try:
         client.check_connection()
@@ -851,8 +1197,7 @@ def main() -> None:
     else:
         fail(f"Unknown mode: '{cfg.mode}'. Use 'launcher', 'api', 'batch', or 'collect'.")
 
-    # Set session IDs output (coerce to str in case vAPI returned ints)
-    session_ids = [str(sid) for sid in session_ids]
+    # Session IDs are already strings: launch_vsif / get_session_ids_by_names coerce them
     set_output("session-ids", ",".join(session_ids))
 
     # Wait for sessions if requested
@@ -862,16 +1207,14 @@ def main() -> None:
         success, aggregated = waiter.wait()
         stats = waiter.get_aggregated_stats(aggregated)
 
-        # Determine final status
-        statuses = set()
-        for info in aggregated.values():
-            statuses.add(info.get("session_status", "unknown"))
-        if len(statuses) == 1:
-            final_status = statuses.pop()
-        elif statuses:
-            final_status = "mixed"
-        else:
-            final_status = "unknown"
+        # Determine final status: the common status, or "mixed" as soon as two differ
+        infos = iter(aggregated.values())
+        first = next(infos, None)
+        final_status = "unknown" if first is None else first.get("session_status", "unknown")
+        for info in infos:
+            if info.get("session_status", "unknown") != final_status:
+                final_status = "mixed"
+                break
 
         set_output("session-status", final_status)
         set_output("total-runs", str(stats["total_runs"]))
@@ -898,21 +1241,23 @@ def main() -> None:
         # Generate JUnit XML
         if cfg.generate_junit:
             log_group_start("JUnit XML Report Generation")
-            extra_list = [a.strip() for a in cfg.extra_attributes.split(",") if a.strip()] if cfg.extra_attributes else []
-            attr_labels = {}
-            if extra_list:
-                attr_labels = client.get_run_attribute_labels(extra_list)
-
-            runs = client.get_runs(session_ids, extra_list if extra_list else None)
-            log(f"Fetched {len(runs)} run(s) for JUnit report.")
-
-            generate_junit_xml(
-                runs=runs,
-                output_path=cfg.junit_output_path,
-                extra_attrs=extra_list,
-                attr_labels=attr_labels,
-                no_append_seed=cfg.no_append_seed,
-            )
+            # The run total is only trustworthy once every session has reported
+            total_runs = stats["total_runs"] if all(sid in aggregated for sid in session_ids) else None
+            if total_runs == 0:
+                # Every session reported zero runs – skip the runs / labels round trips
+                log("Sessions have no runs – writing an empty JUnit report.")
+                _write_empty_junit(cfg.junit_output_path)
+            else:
+                runs, attr_labels = client.iter_runs_with_attr_labels(
+                    session_ids, cfg.extra_attrs, total_runs
+                )
+                generate_junit_xml(
+                    runs=runs,
+                    output_path=cfg.junit_output_path,
+                    extra_attrs=cfg.extra_attrs,
+                    attr_labels=attr_labels,
+                    no_append_seed=cfg.no_append_seed,
+                )
             set_output("junit-report-path", cfg.junit_output_path)
             log_group_end()
 
@@ -929,25 +1274,27 @@ def main() -> None:
 
 def _write_session_status(session_ids: list[str], aggregated: dict, vapi_url: str) -> None:
     """Write a session_status.properties file for downstream use."""
-    lines = []
-    for sid in session_ids:
-        info = aggregated.get(sid, {})
-        lines.append(f"# Session {sid}")
-        lines.append(f"status={info.get('session_status', 'NA')}")
-        lines.append(f"name={info.get('name', 'NA')}")
-        lines.append(f"total_runs_in_session={info.get('total_runs_in_session', 'NA')}")
-        lines.append(f"passed_runs={info.get('passed_runs', 'NA')}")
-        lines.append(f"failed_runs={info.get('failed_runs', 'NA')}")
-        lines.append(f"running={info.get('running', 'NA')}")
-        lines.append(f"waiting={info.get('waiting', 'NA')}")
-        lines.append(f"other_runs={info.get('other_runs', 'NA')}")
-        lines.append(f"owner={info.get('owner', 'NA')}")
-        lines.append(f"id={sid}")
-        lines.append(f"url={vapi_url}")
-        lines.append("")
-
-    with open("session_status.properties", "w") as f:
-        f.write("\n".join(lines))
+    def blocks():
+        for sid in session_ids:
+            g = aggregated.get(sid, {}).get
+            yield (
+                f"# Session {sid}\n"
+                f"status={g('session_status', 'NA')}\n"
+                f"name={g('name', 'NA')}\n"
+                f"total_runs_in_session={g('total_runs_in_session', 'NA')}\n"
+                f"passed_runs={g('passed_runs', 'NA')}\n"
+                f"failed_runs={g('failed_runs', 'NA')}\n"
+                f"running={g('running', 'NA')}\n"
+                f"waiting={g('waiting', 'NA')}\n"
+                f"other_runs={g('other_runs', 'NA')}\n"
+                f"owner={g('owner', 'NA')}\n"
+                f"id={sid}\n"
+                f"url={vapi_url}\n"
+                "\n"
+            )
+
+    with open("session_status.properties", "w", buffering=1 << 16) as f:
+        f.writelines(blocks())
     log("Session status written to session_status.properties")
 
 